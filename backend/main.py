@@ -1,21 +1,53 @@
+import asyncio
+import contextlib
+import functools
+import hashlib
+import json
 import os
+import random
+import re
 import shutil
-import threading
+import tempfile
+import time
 import urllib.parse
 import uuid
+import weakref
 import base64
-from dataclasses import dataclass
+from collections.abc import AsyncIterator, Awaitable, Callable, MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Any
 
-import requests
+import httpx
+import orjson
+import redis.asyncio as redis
 import uvicorn
-from apscheduler.schedulers.background import BackgroundScheduler
-from fastapi import BackgroundTasks, FastAPI, Query
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from cachetools import LRUCache, TTLCache
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from git import GitCommandError, Repo
+from fastapi.responses import ORJSONResponse, Response
+from filelock import AsyncFileLock, Timeout
+from git import GitCommandError
 from pydantic import BaseModel, Field, field_validator
 
-app = FastAPI()
+
+@contextlib.asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    scheduler.start()
+    scheduler.add_job(_prune_mirrors, "interval", days=1, id="prune_mirrors", next_run_time=datetime.now())
+    try:
+        yield
+    finally:
+        if scheduler.running:
+            scheduler.shutdown(wait=False)
+        await http_client.aclose()
+        if redis_client is not None:
+            await redis_client.aclose()
+
+
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # CORS configuration: credentialed requests are not needed for this token-based API.
 app.add_middleware(
@@ -26,15 +58,84 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-scheduler = BackgroundScheduler()
-scheduler.start()
+# Concurrent git fetches and pushes (asyncio subprocesses).
+MAX_CONCURRENT_GIT_TRANSFERS = min(8, (os.cpu_count() or 1) * 2)
+git_fetch_slots = asyncio.Semaphore(MAX_CONCURRENT_GIT_TRANSFERS)
+git_push_slots = asyncio.Semaphore(MAX_CONCURRENT_GIT_TRANSFERS)
+
+# In-flight provider API calls across all running migrations.
+MAX_CONCURRENT_METADATA_CALLS = 12
+metadata_slots = asyncio.Semaphore(MAX_CONCURRENT_METADATA_CALLS)
+
+GRAPHQL_BATCH_SIZE = 50
+
+scheduler = AsyncIOScheduler(job_defaults={"max_instances": 1, "coalesce": True})
+
+# Manual job records expire a day after their last update.
+JOB_RETENTION_SECONDS = 86_400
+MAX_TRACKED_JOBS = 10_000
+migration_jobs: TTLCache[str, dict[str, Any]] = TTLCache(maxsize=MAX_TRACKED_JOBS, ttl=JOB_RETENTION_SECONDS)
+# Serialized /status bodies, refreshed on every job update.
+job_status_json: TTLCache[str, bytes] = TTLCache(maxsize=MAX_TRACKED_JOBS, ttl=JOB_RETENTION_SECONDS)
+# Scheduled job records live as long as their schedule.
+SCHEDULED_JOB_PREFIX = "sched_"
+scheduled_jobs: dict[str, dict[str, Any]] = {}
+scheduled_job_status_json: dict[str, bytes] = {}
+NOT_FOUND_STATUS_JSON = orjson.dumps({"status": "not_found"})
+MAX_ERROR_LENGTH = 4000
+
+# With REDIS_URL, job state is shared by every uvicorn worker.
+REDIS_URL = os.environ.get("REDIS_URL")
+redis_client = redis.Redis.from_url(REDIS_URL, decode_responses=True) if REDIS_URL else None
 
-migration_jobs: dict[str, dict[str, Any]] = {}
-migration_jobs_lock = threading.Lock()
+# Serializes jobs per source repository; entries go once unused.
+source_repo_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = weakref.WeakValueDictionary()
 
 REQUEST_TIMEOUT_SECONDS = 30
 METADATA_SUPPORTED_PROVIDERS = {"github", "gitlab", "bitbucket"}
 
+MAX_REQUEST_ATTEMPTS = 5
+MAX_RETRY_DELAY_SECONDS = 300
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+
+# ETag/Last-Modified cache for provider GET requests, keyed by hash.
+MAX_CACHED_RESPONSES = 512
+response_cache: LRUCache[str, tuple[dict[str, str], Any, "PageInfo"]] = LRUCache(maxsize=MAX_CACHED_RESPONSES)
+
+# Bare mirror per source repository; MIGRATOR_MIRRORS overrides the location.
+MIRROR_CACHE_DIR = os.path.abspath(
+    os.environ.get("MIGRATOR_MIRRORS") or os.path.join(os.path.expanduser("~"), ".cache", "git-migrator", "mirrors")
+)
+MIRROR_MAX_IDLE_SECONDS = 30 * 86_400
+MIRROR_FETCH_REFSPECS = ("+refs/heads/*:refs/heads/*", "+refs/tags/*:refs/tags/*")
+
+# Applied to every git command through GIT_CONFIG_* variables.
+GIT_TRANSPORT_CONFIG = {
+    "http.postBuffer": "524288000",
+    "http.version": "HTTP/2",
+    "pack.threads": "0",
+    "pack.windowMemory": "256m",
+    "pack.compression": "1",
+    "protocol.version": "2",
+    "http.lowSpeedLimit": "1024",
+    "http.lowSpeedTime": "30",
+}
+
+# Throwaway clones go to /dev/shm when it has room; MIGRATOR_TMP overrides.
+TMPFS_ROOT = "/dev/shm/git-migrator"
+TMPFS_MIN_FREE_BYTES = 1024**3
+
+trash_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="trash")
+
+http_client = httpx.AsyncClient(
+    timeout=REQUEST_TIMEOUT_SECONDS,
+    transport=httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=3,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    ),
+)
+
 
 class MigrationActions(BaseModel):
     migrate_repo: bool = True
@@ -44,6 +145,10 @@ class MigrationActions(BaseModel):
     migrate_issues: bool = False
     migrate_prs: bool = False
     migrate_users: bool = False
+    # Shallow/partial copies only work if the destination has the omitted history.
+    clone_depth: int | None = Field(default=None, ge=1)
+    partial_clone: bool = False
+    push_batch_size: int = Field(default=1000, ge=1)
 
     @field_validator("specific_branches", mode="before")
     @classmethod
@@ -83,54 +188,40 @@ class RepoContext:
     repo_url: str
     host: str
     path: str
+    # Derived in __post_init__; headers is shared and must not be mutated.
+    owner: str = field(init=False, default="")
+    repo: str = field(init=False, default="")
+    repo_path: str = field(init=False, default="")
+    project_id: str = field(init=False, default="")
+    headers: dict[str, str] = field(init=False, default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.provider == "github":
+            self.headers = _github_headers(self.token)
+        elif self.provider == "gitlab":
+            self.headers = _gitlab_headers(self.token)
+        elif self.provider == "bitbucket":
+            self.headers = _bitbucket_headers(self.token)
+
+        if self.provider == "gitlab":
+            if not self.path:
+                raise ValueError(f"Invalid GitLab repository URL: {self.repo_url}")
+            self.repo_path = self.path
+            self.project_id = urllib.parse.quote(self.path, safe="")
+            return
 
-    @property
-    def github_owner(self) -> str:
-        parts = self.path.split("/")
-        if len(parts) < 2:
-            raise ValueError(f"Invalid GitHub repository URL: {self.repo_url}")
-        return parts[-2]
-
-    @property
-    def github_repo(self) -> str:
-        parts = self.path.split("/")
-        if len(parts) < 2:
-            raise ValueError(f"Invalid GitHub repository URL: {self.repo_url}")
-        return parts[-1]
-
-    @property
-    def github_repo_path(self) -> str:
-        return f"{self.github_owner}/{self.github_repo}"
-
-    @property
-    def gitlab_project_path(self) -> str:
-        if not self.path:
-            raise ValueError(f"Invalid GitLab repository URL: {self.repo_url}")
-        return self.path
-
-    @property
-    def gitlab_project_id(self) -> str:
-        return urllib.parse.quote(self.gitlab_project_path, safe="")
-
-    @property
-    def bitbucket_workspace(self) -> str:
-        parts = self.path.split("/")
-        if len(parts) < 2:
-            raise ValueError(f"Invalid Bitbucket repository URL: {self.repo_url}")
-        return parts[-2]
-
-    @property
-    def bitbucket_repo_slug(self) -> str:
         parts = self.path.split("/")
         if len(parts) < 2:
-            raise ValueError(f"Invalid Bitbucket repository URL: {self.repo_url}")
-        return parts[-1]
-
-    @property
-    def bitbucket_repo_path(self) -> str:
-        return f"{self.bitbucket_workspace}/{self.bitbucket_repo_slug}"
+            if self.provider in {"github", "bitbucket"}:
+                label = "GitHub" if self.provider == "github" else "Bitbucket"
+                raise ValueError(f"Invalid {label} repository URL: {self.repo_url}")
+            return
+        self.owner = parts[-2]
+        self.repo = parts[-1]
+        self.repo_path = f"{self.owner}/{self.repo}"
 
 
+@functools.lru_cache(maxsize=1024)
 def _normalize_repo_url(url: str) -> urllib.parse.ParseResult:
     normalized = url.strip()
     if not normalized:
@@ -157,33 +248,209 @@ def _repo_context(provider: str, token: str, repo_url: str) -> RepoContext:
     )
 
 
+@functools.lru_cache(maxsize=1024)
+def _repo_name(url: str) -> str:
+    return url.rstrip("/").split("/")[-1].removesuffix(".git") or "repository"
+
+
 def get_auth_url(url: str, token: str, provider: str) -> str:
-    clean_url = url.replace("https://", "").replace("http://", "")
+    parsed = _normalize_repo_url(url)
+    location = parsed.netloc.rpartition("@")[2] + parsed.path
     if provider == "bitbucket" and ":" in token:
         username, app_password = token.split(":", 1)
         encoded_username = urllib.parse.quote(username, safe="")
         encoded_password = urllib.parse.quote(app_password, safe="")
-        return f"https://{encoded_username}:{encoded_password}@{clean_url}"
+        return f"https://{encoded_username}:{encoded_password}@{location}"
 
     encoded_token = urllib.parse.quote(token, safe="")
     if provider == "gitlab":
-        return f"https://oauth2:{encoded_token}@{clean_url}"
-    return f"https://{encoded_token}@{clean_url}"
+        return f"https://oauth2:{encoded_token}@{location}"
+    return f"https://{encoded_token}@{location}"
+
+
+def _clone_options(actions: MigrationActions) -> list[str]:
+    options: list[str] = []
+    if actions.clone_depth:
+        # --depth implies --single-branch; keep every branch and tag reachable.
+        options.extend(["--depth", str(actions.clone_depth), "--no-single-branch"])
+    if actions.partial_clone:
+        options.append("--filter=blob:none")
+    return options
+
+
+def _mirror_path(source_repo_url: str) -> str:
+    key = source_repo_url.strip().rstrip("/")
+    return os.path.join(MIRROR_CACHE_DIR, f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.git")
+
+
+def _git_config_env(settings: dict[str, str]) -> dict[str, str]:
+    env = {"GIT_CONFIG_COUNT": str(len(settings))}
+    for index, (key, value) in enumerate(settings.items()):
+        env[f"GIT_CONFIG_KEY_{index}"] = key
+        env[f"GIT_CONFIG_VALUE_{index}"] = value
+    return env
 
 
-def _update_job(job_id: str, **updates: Any) -> None:
-    with migration_jobs_lock:
-        if job_id not in migration_jobs:
-            migration_jobs[job_id] = {"status": "pending", "results": {}, "error": None}
-        migration_jobs[job_id].update(updates)
+GIT_ENV = _git_config_env(GIT_TRANSPORT_CONFIG)
+
+
+def _temp_repos_root() -> str:
+    configured = os.environ.get("MIGRATOR_TMP")
+    if configured:
+        return configured
+    if os.path.isdir("/dev/shm") and shutil.disk_usage("/dev/shm").free >= TMPFS_MIN_FREE_BYTES:
+        return TMPFS_ROOT
+    return os.path.join(tempfile.gettempdir(), "git-migrator")
+
+
+async def _git(*args: str) -> str:
+    process = await asyncio.create_subprocess_exec(
+        "git",
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        # Never wait on an interactive credential prompt.
+        env={**os.environ, **GIT_ENV, "GIT_TERMINAL_PROMPT": "0"},
+    )
+    stdout, stderr = await process.communicate()
+    if process.returncode:
+        raise GitCommandError(["git", *args], process.returncode, stderr, stdout)
+    return stdout.decode("utf-8", "replace").strip()
+
+
+async def _sync_mirror(mirror_path: str, source_auth: str) -> None:
+    if not os.path.isdir(mirror_path):
+        await _git("init", "--bare", "--quiet", mirror_path)
+    # Fetch by URL so credentials are never written into the mirror's config.
+    await _git(
+        "-C",
+        mirror_path,
+        "-c",
+        "gc.auto=0",
+        "fetch",
+        "--prune",
+        "--quiet",
+        source_auth,
+        *MIRROR_FETCH_REFSPECS,
+    )
+
+
+async def _maintain_mirror(mirror_path: str) -> None:
+    try:
+        await _git("-C", mirror_path, "gc", "--auto", "--quiet")
+    except GitCommandError:
+        pass
+    os.utime(mirror_path)
+
+
+async def _prune_mirrors() -> None:
+    try:
+        with os.scandir(MIRROR_CACHE_DIR) as iterator:
+            mirrors = [entry.path for entry in iterator if entry.name.endswith(".git") and entry.is_dir()]
+    except OSError:
+        return
+
+    cutoff = time.time() - MIRROR_MAX_IDLE_SECONDS
+    for mirror_path in mirrors:
+        lock_path = f"{mirror_path}.lock"
+        try:
+            async with AsyncFileLock(lock_path, timeout=0):
+                if os.path.getmtime(mirror_path) >= cutoff:
+                    continue
+                await asyncio.get_running_loop().run_in_executor(trash_executor, _fast_rmtree, mirror_path)
+                os.unlink(lock_path)
+        except (Timeout, OSError):
+            continue
+
+
+def _fast_rmtree(path: str) -> None:
+    try:
+        with os.scandir(path) as iterator:
+            entries = sorted(iterator, key=lambda entry: entry.inode())
+    except OSError:
+        return
+
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                _fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+        except OSError:
+            continue
+
+    try:
+        os.rmdir(path)
+    except OSError:
+        pass
+
+
+def _job_stores(job_id: str) -> tuple[MutableMapping[str, dict[str, Any]], MutableMapping[str, bytes]]:
+    if job_id.startswith(SCHEDULED_JOB_PREFIX):
+        return scheduled_jobs, scheduled_job_status_json
+    return migration_jobs, job_status_json
+
+
+async def _update_job(job_id: str, **updates: Any) -> None:
+    if redis_client is not None:
+        key = f"job:{job_id}"
+        async with redis_client.pipeline() as pipe:
+            pipe.hsetnx(key, "status", json.dumps("pending"))
+            pipe.hsetnx(key, "results", json.dumps({}))
+            pipe.hsetnx(key, "error", json.dumps(None))
+            if updates:
+                pipe.hset(key, mapping={field: json.dumps(value) for field, value in updates.items()})
+            if not job_id.startswith(SCHEDULED_JOB_PREFIX):
+                pipe.expire(key, JOB_RETENTION_SECONDS)
+            await pipe.execute()
+        return
+
+    records, serialized = _job_stores(job_id)
+    previous = records.get(job_id) or {"status": "pending", "results": {}, "error": None}
+    record = {**previous, **updates}
+    records[job_id] = record
+    serialized[job_id] = orjson.dumps(record)
+
+
+async def _job_status_json(job_id: str) -> bytes | None:
+    if redis_client is not None:
+        record = await redis_client.hgetall(f"job:{job_id}")
+        if not record:
+            return None
+        # Each field is already JSON.
+        fields = ",".join(f"{json.dumps(field)}:{value}" for field, value in record.items())
+        return f"{{{fields}}}".encode()
+
+    return _job_stores(job_id)[1].get(job_id)
+
+
+@functools.lru_cache(maxsize=256)
+def _redaction_pattern(secrets: tuple[str, ...]) -> re.Pattern[str]:
+    # Longest first, so a token that prefixes another cannot leave a tail behind.
+    return re.compile("|".join(re.escape(secret) for secret in sorted(secrets, key=len, reverse=True)))
 
 
 def _redact_sensitive(text: str, req: MigrationRequest) -> str:
-    scrubbed = text
-    for secret in (req.source_token, req.dest_token):
-        if secret:
-            scrubbed = scrubbed.replace(secret, "***")
-    return scrubbed
+    secrets: set[str] = set()
+    for token in (req.source_token, req.dest_token):
+        if not token:
+            continue
+        secrets.update((token, urllib.parse.quote(token, safe="")))
+        if ":" in token:
+            app_password = token.split(":", 1)[1]
+            secrets.update((app_password, urllib.parse.quote(app_password, safe="")))
+    secrets.discard("")
+    if not secrets:
+        return text
+    return _redaction_pattern(tuple(sorted(secrets))).sub("***", text)
+
+
+def _job_error(text: str, req: MigrationRequest) -> str:
+    message = _redact_sensitive(text, req)
+    if len(message) <= MAX_ERROR_LENGTH:
+        return message
+    half = MAX_ERROR_LENGTH // 2
+    return f"{message[:half]}\n... [{len(message) - MAX_ERROR_LENGTH} characters omitted] ...\n{message[-half:]}"
 
 
 def _metadata_supported(src: RepoContext, dst: RepoContext) -> bool:
@@ -227,111 +494,310 @@ def _provider_api_base(context: RepoContext) -> str:
     raise ValueError(f"Unsupported provider: {context.provider}")
 
 
-def _request_json(
+def _graphql_url(context: RepoContext) -> str:
+    if context.provider == "github" and context.host.lower() in {"github.com", "www.github.com"}:
+        return "https://api.github.com/graphql"
+    return f"https://{context.host}/api/graphql"
+
+
+@dataclass(frozen=True)
+class PageInfo:
+    next_url: str | None = None
+    last_page: int | None = None
+
+
+def _last_page(response: httpx.Response) -> int | None:
+    total_pages = response.headers.get("X-Total-Pages")
+    if total_pages and total_pages.isdigit():
+        return int(total_pages)
+    last_url = response.links.get("last", {}).get("url")
+    if last_url:
+        page = urllib.parse.parse_qs(urllib.parse.urlsplit(last_url).query).get("page")
+        if page and page[0].isdigit():
+            return int(page[0])
+    return None
+
+
+def _response_cache_key(url: str, headers: dict[str, str], params: dict[str, Any] | None) -> str:
+    material = json.dumps([url, sorted(headers.items()), sorted((params or {}).items())], default=str)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _retry_delay(method: str, response: httpx.Response, attempt: int, idempotent: bool = False) -> float | None:
+    status = response.status_code
+    # GitHub signals primary and secondary rate limits with a 403.
+    rate_limited = status == 429 or (
+        status == 403
+        and (response.headers.get("X-RateLimit-Remaining") == "0" or "Retry-After" in response.headers)
+    )
+    if not rate_limited and status not in RETRYABLE_STATUS_CODES:
+        return None
+    # A gateway error may hide a create that went through; do not repeat it.
+    if method == "POST" and not idempotent and not rate_limited and status != 503:
+        return None
+
+    retry_after = response.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return float(retry_after)
+    # The reset headers ride on every response, not just rate-limited ones.
+    if rate_limited:
+        reset = response.headers.get("X-RateLimit-Reset") or response.headers.get("RateLimit-Reset") or ""
+        if reset.isdigit():
+            return max(0.0, int(reset) - time.time()) + random.random()
+    return 2**attempt + random.random()
+
+
+async def _send(
     method: str,
     url: str,
     headers: dict[str, str],
     *,
     params: dict[str, Any] | None = None,
     json_body: dict[str, Any] | None = None,
-) -> Any:
-    response = requests.request(
-        method=method,
-        url=url,
-        headers=headers,
-        params=params,
-        json=json_body,
-        timeout=REQUEST_TIMEOUT_SECONDS,
-    )
+    idempotent: bool = False,
+) -> httpx.Response:
+    content: bytes | None = None
+    if json_body is not None:
+        content = orjson.dumps(json_body)
+        headers = {**headers, "Content-Type": "application/json"}
+
+    attempt = 0
+    while True:
+        response = await http_client.request(
+            method,
+            url,
+            headers=headers,
+            params=params,
+            content=content,
+        )
+        attempt += 1
+        delay = _retry_delay(method, response, attempt, idempotent)
+        if delay is None or delay > MAX_RETRY_DELAY_SECONDS or attempt >= MAX_REQUEST_ATTEMPTS:
+            return response
+        await asyncio.sleep(delay)
+
+
+async def _fetch_json(
+    method: str,
+    url: str,
+    headers: dict[str, str],
+    *,
+    params: dict[str, Any] | None = None,
+    json_body: dict[str, Any] | None = None,
+    idempotent: bool = False,
+) -> tuple[Any, PageInfo]:
+    cache_key: str | None = None
+    cached: tuple[dict[str, str], Any, PageInfo] | None = None
+    request_headers = headers
+    if method == "GET":
+        cache_key = _response_cache_key(url, headers, params)
+        cached = response_cache.get(cache_key)
+        if cached is not None:
+            request_headers = {**headers, **cached[0]}
+
+    response = await _send(method, url, request_headers, params=params, json_body=json_body, idempotent=idempotent)
+
+    if cached is not None and response.status_code == 304:
+        return cached[1], cached[2]
 
     if response.status_code >= 400:
-        snippet = response.text[:400].replace("\n", " ")
+        snippet = response.content[:400].decode("utf-8", "replace").replace("\n", " ")
         raise RuntimeError(f"{method} {url} failed with {response.status_code}: {snippet}")
 
-    if not response.content:
-        return {}
+    payload = orjson.loads(response.content) if response.content else {}
+    page_info = PageInfo(
+        next_url=response.links.get("next", {}).get("url"),
+        last_page=_last_page(response),
+    )
+
+    if cache_key is not None:
+        validators = {}
+        if "ETag" in response.headers:
+            validators["If-None-Match"] = response.headers["ETag"]
+        if "Last-Modified" in response.headers:
+            validators["If-Modified-Since"] = response.headers["Last-Modified"]
+        if validators:
+            response_cache[cache_key] = (validators, payload, page_info)
 
-    return response.json()
+    return payload, page_info
 
 
-def _request_raw(
+async def _request_json(
     method: str,
     url: str,
     headers: dict[str, str],
     *,
     params: dict[str, Any] | None = None,
     json_body: dict[str, Any] | None = None,
-) -> requests.Response:
-    response = requests.request(
-        method=method,
-        url=url,
-        headers=headers,
-        params=params,
-        json=json_body,
-        timeout=REQUEST_TIMEOUT_SECONDS,
-    )
-    return response
+    idempotent: bool = False,
+) -> Any:
+    payload, _ = await _fetch_json(method, url, headers, params=params, json_body=json_body, idempotent=idempotent)
+    return payload
+
+
+async def _request_raw(
+    method: str,
+    url: str,
+    headers: dict[str, str],
+    *,
+    params: dict[str, Any] | None = None,
+    json_body: dict[str, Any] | None = None,
+) -> httpx.Response:
+    return await _send(method, url, headers, params=params, json_body=json_body)
 
 
-def _bitbucket_paginated_get(
+async def _link_paginated_get(
+    url: str,
+    headers: dict[str, str],
+    *,
+    params: dict[str, Any] | None = None,
+) -> list[dict[str, Any]]:
+    query_params: dict[str, Any] = {**(params or {}), "per_page": 100}
+    payload, page_info = await _fetch_json("GET", url, headers, params=query_params)
+    if not payload:
+        return []
+    items: list[dict[str, Any]] = list(payload)
+
+    if page_info.last_page is not None:
+
+        async def fetch_page(page: int) -> Any:
+            async with metadata_slots:
+                page_payload, _ = await _fetch_json("GET", url, headers, params={**query_params, "page": page})
+                return page_payload
+
+        pages = await asyncio.gather(*(fetch_page(page) for page in range(2, page_info.last_page + 1)))
+        for page_payload in pages:
+            items.extend(page_payload or [])
+        return items
+
+    next_url = page_info.next_url
+    while next_url:
+        payload, page_info = await _fetch_json("GET", next_url, headers)
+        if not payload:
+            break
+        items.extend(payload)
+        next_url = page_info.next_url
+
+    return items
+
+
+async def _bitbucket_paginated_get(
     url: str,
     headers: dict[str, str],
     *,
     params: dict[str, Any] | None = None,
-    max_pages: int = 10,
 ) -> list[dict[str, Any]]:
-    items: list[dict[str, Any]] = []
-    page = 0
-    next_url: str | None = url
     query_params = dict(params or {})
     query_params.setdefault("pagelen", 100)
-
-    while next_url and page < max_pages:
-        page += 1
-        payload = _request_json("GET", next_url, headers, params=query_params if page == 1 else None)
-        values = payload.get("values", [])
-        if isinstance(values, list):
-            items.extend(values)
+    if "fields" in query_params:
+        query_params["fields"] += ",size,pagelen"
+
+    payload = await _request_json("GET", url, headers, params=query_params)
+    items: list[dict[str, Any]] = list(payload.get("values") or [])
+
+    size = payload.get("size")
+    pagelen = payload.get("pagelen")
+    if payload.get("next") and isinstance(size, int) and isinstance(pagelen, int) and pagelen > 0:
+
+        async def fetch_page(page: int) -> Any:
+            async with metadata_slots:
+                return await _request_json("GET", url, headers, params={**query_params, "page": page})
+
+        last_page = -(-size // pagelen)
+        pages = await asyncio.gather(*(fetch_page(page) for page in range(2, last_page + 1)))
+        for page_payload in pages:
+            items.extend(page_payload.get("values") or [])
+        return items
+
+    next_url = payload.get("next")
+    while next_url:
+        payload = await _request_json("GET", next_url, headers)
+        items.extend(payload.get("values") or [])
         next_url = payload.get("next")
-        query_params = {}
 
     return items
 
 
-def _list_github_issues(context: RepoContext) -> list[dict[str, Any]]:
-    api_base = _provider_api_base(context)
-    headers = _github_headers(context.token)
-    issues: list[dict[str, Any]] = []
-
-    for page in range(1, 11):
-        payload = _request_json(
-            "GET",
-            f"{api_base}/repos/{context.github_repo_path}/issues",
-            headers,
-            params={"state": "all", "per_page": 100, "page": page},
+async def _graphql(context: RepoContext, query: str, variables: dict[str, Any]) -> dict[str, Any]:
+    payload = await _request_json(
+        "POST",
+        _graphql_url(context),
+        context.headers,
+        json_body={"query": query, "variables": variables},
+        # Queries are read-only, so a gateway error can safely be retried.
+        idempotent=not query.lstrip().startswith("mutation"),
+    )
+    if payload.get("errors") and not payload.get("data"):
+        raise RuntimeError(f"GraphQL request failed: {payload['errors'][0].get('message', 'unknown error')}")
+    return payload.get("data") or {}
+
+
+async def _close_github_nodes(context: RepoContext, mutation: str, id_field: str, node_ids: list[str]) -> int:
+    # GitHub cannot create an item closed; close them afterwards in batches.
+    closed = 0
+    for start in range(0, len(node_ids), GRAPHQL_BATCH_SIZE):
+        batch = node_ids[start : start + GRAPHQL_BATCH_SIZE]
+        declarations = ", ".join(f"$id{index}: ID!" for index in range(len(batch)))
+        fields = " ".join(
+            f"c{index}: {mutation}(input: {{{id_field}: $id{index}}}) {{ clientMutationId }}"
+            for index in range(len(batch))
         )
-        if not payload:
-            break
+        try:
+            data = await _graphql(
+                context,
+                f"mutation({declarations}) {{ {fields} }}",
+                {f"id{index}": node_id for index, node_id in enumerate(batch)},
+            )
+        except Exception:
+            continue
+        closed += sum(1 for value in data.values() if value is not None)
+    return closed
 
-        for item in payload:
-            # GitHub returns PRs in /issues; ignore here.
-            if "pull_request" in item:
-                continue
-            issues.append(item)
 
-        if len(payload) < 100:
-            break
+GITHUB_ISSUES_QUERY = """
+query($owner: String!, $name: String!, $after: String) {
+  repository(owner: $owner, name: $name) {
+    issues(first: 100, after: $after, orderBy: {field: CREATED_AT, direction: ASC}) {
+      nodes { title body state labels(first: 100) { nodes { name } } }
+      pageInfo { endCursor hasNextPage }
+    }
+  }
+}
+"""
+
 
-    return issues
+async def _list_github_issues(context: RepoContext) -> list[dict[str, Any]]:
+    # REST /issues interleaves every pull request; GraphQL lists issues only.
+    items: list[dict[str, Any]] = []
+    variables: dict[str, Any] = {"owner": context.owner, "name": context.repo, "after": None}
+
+    while True:
+        data = await _graphql(context, GITHUB_ISSUES_QUERY, variables)
+        repository = data.get("repository")
+        if repository is None:
+            raise RuntimeError(f"GitHub repository not found: {context.repo_path}")
+        connection = repository["issues"]
+        items.extend(
+            {
+                "title": node["title"],
+                "body": node["body"],
+                "state": node["state"].lower(),
+                "labels": [{"name": label["name"]} for label in node["labels"]["nodes"]],
+            }
+            for node in connection["nodes"]
+        )
+        if not connection["pageInfo"]["hasNextPage"]:
+            return items
+        variables["after"] = connection["pageInfo"]["endCursor"]
 
 
-def _create_github_issue(context: RepoContext, issue: dict[str, Any]) -> None:
+async def _create_github_issue(context: RepoContext, issue: dict[str, Any]) -> str | None:
     api_base = _provider_api_base(context)
-    headers = _github_headers(context.token)
+    headers = context.headers
 
-    created = _request_json(
+    created = await _request_json(
         "POST",
-        f"{api_base}/repos/{context.github_repo_path}/issues",
+        f"{api_base}/repos/{context.repo_path}/issues",
         headers,
         json_body={
             "title": issue.get("title", "Untitled issue"),
@@ -340,46 +806,27 @@ def _create_github_issue(context: RepoContext, issue: dict[str, Any]) -> None:
         },
     )
 
-    if issue.get("state") == "closed":
-        _request_json(
-            "PATCH",
-            f"{api_base}/repos/{context.github_repo_path}/issues/{created['number']}",
-            headers,
-            json_body={"state": "closed"},
-        )
+    return created["node_id"] if issue.get("state") == "closed" else None
 
 
-def _list_gitlab_issues(context: RepoContext) -> list[dict[str, Any]]:
+async def _list_gitlab_issues(context: RepoContext) -> list[dict[str, Any]]:
     api_base = _provider_api_base(context)
-    headers = _gitlab_headers(context.token)
-    issues: list[dict[str, Any]] = []
-
-    for page in range(1, 11):
-        payload = _request_json(
-            "GET",
-            f"{api_base}/projects/{context.gitlab_project_id}/issues",
-            headers,
-            params={"state": "all", "per_page": 100, "page": page},
-        )
-        if not payload:
-            break
-
-        issues.extend(payload)
-
-        if len(payload) < 100:
-            break
-
-    return issues
+    headers = context.headers
+    return await _link_paginated_get(
+        f"{api_base}/projects/{context.project_id}/issues",
+        headers,
+        params={"state": "all"},
+    )
 
 
-def _create_gitlab_issue(context: RepoContext, issue: dict[str, Any]) -> None:
+async def _create_gitlab_issue(context: RepoContext, issue: dict[str, Any]) -> None:
     api_base = _provider_api_base(context)
-    headers = _gitlab_headers(context.token)
+    headers = context.headers
     labels = issue.get("labels", [])
 
-    created = _request_json(
+    created = await _request_json(
         "POST",
-        f"{api_base}/projects/{context.gitlab_project_id}/issues",
+        f"{api_base}/projects/{context.project_id}/issues",
         headers,
         json_body={
             "title": issue.get("title", "Untitled issue"),
@@ -389,141 +836,138 @@ def _create_gitlab_issue(context: RepoContext, issue: dict[str, Any]) -> None:
     )
 
     if issue.get("state") == "closed":
-        _request_json(
+        await _request_json(
             "PUT",
-            f"{api_base}/projects/{context.gitlab_project_id}/issues/{created['iid']}",
+            f"{api_base}/projects/{context.project_id}/issues/{created['iid']}",
             headers,
             json_body={"state_event": "close"},
         )
 
 
-def _list_bitbucket_issues(context: RepoContext) -> list[dict[str, Any]]:
+async def _list_bitbucket_issues(context: RepoContext) -> list[dict[str, Any]]:
     api_base = _provider_api_base(context)
-    headers = _bitbucket_headers(context.token)
-    return _bitbucket_paginated_get(
-        f"{api_base}/repositories/{context.bitbucket_repo_path}/issues",
+    headers = context.headers
+    return await _bitbucket_paginated_get(
+        f"{api_base}/repositories/{context.repo_path}/issues",
         headers,
         params={"q": 'state="new" OR state="open" OR state="resolved" OR state="closed"'},
     )
 
 
-def _create_bitbucket_issue(context: RepoContext, issue: dict[str, Any]) -> None:
+async def _create_bitbucket_issue(context: RepoContext, issue: dict[str, Any]) -> None:
     api_base = _provider_api_base(context)
-    headers = _bitbucket_headers(context.token)
-    created = _request_json(
+    headers = context.headers
+    await _request_json(
         "POST",
-        f"{api_base}/repositories/{context.bitbucket_repo_path}/issues",
+        f"{api_base}/repositories/{context.repo_path}/issues",
         headers,
         json_body={
             "title": issue.get("title", "Untitled issue"),
             "content": {"raw": issue.get("description") or ""},
+            "state": "resolved" if issue.get("state") == "closed" else "new",
         },
     )
-    if issue.get("state") == "closed":
-        _request_json(
-            "PUT",
-            f"{api_base}/repositories/{context.bitbucket_repo_path}/issues/{created['id']}",
-            headers,
-            json_body={"state": "resolved"},
-        )
 
 
-def _normalize_issue_from_source(provider: str, issue: dict[str, Any]) -> dict[str, Any]:
-    if provider == "github":
-        return {
-            "title": issue.get("title", "Untitled issue"),
-            "description": issue.get("body") or "",
-            "state": issue.get("state", "open"),
-            "labels": [label.get("name") for label in issue.get("labels", []) if isinstance(label, dict) and label.get("name")],
-        }
+def _normalize_github_issue(issue: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "title": issue.get("title", "Untitled issue"),
+        "description": issue.get("body") or "",
+        "state": issue.get("state", "open"),
+        "labels": [label.get("name") for label in issue.get("labels", []) if isinstance(label, dict) and label.get("name")],
+    }
 
-    if provider == "gitlab":
-        return {
-            "title": issue.get("title", "Untitled issue"),
-            "description": issue.get("description") or "",
-            "state": issue.get("state", "opened").replace("opened", "open"),
-            "labels": issue.get("labels", []),
-        }
 
-    if provider == "bitbucket":
-        return {
-            "title": issue.get("title", "Untitled issue"),
-            "description": issue.get("content", {}).get("raw", ""),
-            "state": "closed" if issue.get("state") in {"resolved", "closed"} else "open",
-            "labels": [],
-        }
+def _normalize_gitlab_issue(issue: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "title": issue.get("title", "Untitled issue"),
+        "description": issue.get("description") or "",
+        "state": issue.get("state", "opened").replace("opened", "open"),
+        "labels": issue.get("labels", []),
+    }
+
 
-    raise ValueError(f"Unsupported provider for issue normalization: {provider}")
+def _normalize_bitbucket_issue(issue: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "title": issue.get("title", "Untitled issue"),
+        "description": issue.get("content", {}).get("raw", ""),
+        "state": "closed" if issue.get("state") in {"resolved", "closed"} else "open",
+        "labels": [],
+    }
 
 
-def migrate_issues(source: RepoContext, destination: RepoContext) -> dict[str, Any]:
+ItemLister = Callable[[RepoContext], Awaitable[list[dict[str, Any]]]]
+ItemCreator = Callable[[RepoContext, dict[str, Any]], Awaitable[str | None]]
+ItemNormalizer = Callable[[dict[str, Any]], dict[str, Any]]
+
+ISSUE_LISTERS: dict[str, ItemLister] = {
+    "github": _list_github_issues,
+    "gitlab": _list_gitlab_issues,
+    "bitbucket": _list_bitbucket_issues,
+}
+ISSUE_CREATORS: dict[str, ItemCreator] = {
+    "github": _create_github_issue,
+    "gitlab": _create_gitlab_issue,
+    "bitbucket": _create_bitbucket_issue,
+}
+ISSUE_NORMALIZERS: dict[str, ItemNormalizer] = {
+    "github": _normalize_github_issue,
+    "gitlab": _normalize_gitlab_issue,
+    "bitbucket": _normalize_bitbucket_issue,
+}
+
+
+async def migrate_issues(source: RepoContext, destination: RepoContext) -> dict[str, Any]:
     if not _metadata_supported(source, destination):
         return {
             "status": "unsupported",
             "message": f"Issues migration supports providers {sorted(METADATA_SUPPORTED_PROVIDERS)}. Got {source.provider} -> {destination.provider}",
         }
 
-    if source.provider == "github":
-        source_items = _list_github_issues(source)
-    elif source.provider == "gitlab":
-        source_items = _list_gitlab_issues(source)
-    else:
-        source_items = _list_bitbucket_issues(source)
+    source_items = await ISSUE_LISTERS[source.provider](source)
+    normalize = ISSUE_NORMALIZERS[source.provider]
+    create = ISSUE_CREATORS[destination.provider]
 
-    created = 0
-    failed = 0
+    async def create_one(item: dict[str, Any]) -> str | None:
+        async with metadata_slots:
+            return await create(destination, normalize(item))
 
-    for item in source_items:
-        normalized = _normalize_issue_from_source(source.provider, item)
-        try:
-            if destination.provider == "github":
-                _create_github_issue(destination, normalized)
-            elif destination.provider == "gitlab":
-                _create_gitlab_issue(destination, normalized)
-            else:
-                _create_bitbucket_issue(destination, normalized)
-            created += 1
-        except Exception:
-            failed += 1
+    outcomes = await asyncio.gather(
+        *(create_one(item) for item in source_items),
+        return_exceptions=True,
+    )
+    failed = sum(isinstance(outcome, Exception) for outcome in outcomes)
+    created = len(outcomes) - failed
+
+    to_close = [outcome for outcome in outcomes if isinstance(outcome, str)]
+    closed = await _close_github_nodes(destination, "closeIssue", "issueId", to_close) if to_close else 0
 
     return {
         "status": "completed",
         "source_count": len(source_items),
         "created": created,
         "failed": failed,
+        "close_failed": len(to_close) - closed,
     }
 
 
-def _list_github_prs(context: RepoContext) -> list[dict[str, Any]]:
+async def _list_github_prs(context: RepoContext) -> list[dict[str, Any]]:
     api_base = _provider_api_base(context)
-    headers = _github_headers(context.token)
-    pulls: list[dict[str, Any]] = []
-
-    for page in range(1, 11):
-        payload = _request_json(
-            "GET",
-            f"{api_base}/repos/{context.github_repo_path}/pulls",
-            headers,
-            params={"state": "all", "per_page": 100, "page": page},
-        )
-        if not payload:
-            break
-
-        pulls.extend(payload)
-
-        if len(payload) < 100:
-            break
-
-    return pulls
+    headers = context.headers
+    return await _link_paginated_get(
+        f"{api_base}/repos/{context.repo_path}/pulls",
+        headers,
+        params={"state": "all"},
+    )
 
 
-def _create_github_pr(context: RepoContext, pr: dict[str, Any]) -> None:
+async def _create_github_pr(context: RepoContext, pr: dict[str, Any]) -> str | None:
     api_base = _provider_api_base(context)
-    headers = _github_headers(context.token)
+    headers = context.headers
 
-    created = _request_json(
+    created = await _request_json(
         "POST",
-        f"{api_base}/repos/{context.github_repo_path}/pulls",
+        f"{api_base}/repos/{context.repo_path}/pulls",
         headers,
         json_body={
             "title": pr.get("title", "Untitled PR"),
@@ -534,45 +978,26 @@ def _create_github_pr(context: RepoContext, pr: dict[str, Any]) -> None:
         },
     )
 
-    if pr.get("state") == "closed":
-        _request_json(
-            "PATCH",
-            f"{api_base}/repos/{context.github_repo_path}/pulls/{created['number']}",
-            headers,
-            json_body={"state": "closed"},
-        )
+    return created["node_id"] if pr.get("state") == "closed" else None
 
 
-def _list_gitlab_mrs(context: RepoContext) -> list[dict[str, Any]]:
+async def _list_gitlab_mrs(context: RepoContext) -> list[dict[str, Any]]:
     api_base = _provider_api_base(context)
-    headers = _gitlab_headers(context.token)
-    merge_requests: list[dict[str, Any]] = []
-
-    for page in range(1, 11):
-        payload = _request_json(
-            "GET",
-            f"{api_base}/projects/{context.gitlab_project_id}/merge_requests",
-            headers,
-            params={"state": "all", "per_page": 100, "page": page},
-        )
-        if not payload:
-            break
-
-        merge_requests.extend(payload)
-
-        if len(payload) < 100:
-            break
-
-    return merge_requests
+    headers = context.headers
+    return await _link_paginated_get(
+        f"{api_base}/projects/{context.project_id}/merge_requests",
+        headers,
+        params={"state": "all"},
+    )
 
 
-def _create_gitlab_mr(context: RepoContext, pr: dict[str, Any]) -> None:
+async def _create_gitlab_mr(context: RepoContext, pr: dict[str, Any]) -> None:
     api_base = _provider_api_base(context)
-    headers = _gitlab_headers(context.token)
+    headers = context.headers
 
-    created = _request_json(
+    created = await _request_json(
         "POST",
-        f"{api_base}/projects/{context.gitlab_project_id}/merge_requests",
+        f"{api_base}/projects/{context.project_id}/merge_requests",
         headers,
         json_body={
             "title": pr.get("title", "Untitled MR"),
@@ -583,31 +1008,31 @@ def _create_gitlab_mr(context: RepoContext, pr: dict[str, Any]) -> None:
     )
 
     if pr.get("state") == "closed":
-        _request_json(
+        await _request_json(
             "PUT",
-            f"{api_base}/projects/{context.gitlab_project_id}/merge_requests/{created['iid']}",
+            f"{api_base}/projects/{context.project_id}/merge_requests/{created['iid']}",
             headers,
             json_body={"state_event": "close"},
         )
 
 
-def _list_bitbucket_prs(context: RepoContext) -> list[dict[str, Any]]:
+async def _list_bitbucket_prs(context: RepoContext) -> list[dict[str, Any]]:
     api_base = _provider_api_base(context)
-    headers = _bitbucket_headers(context.token)
-    return _bitbucket_paginated_get(
-        f"{api_base}/repositories/{context.bitbucket_repo_path}/pullrequests",
+    headers = context.headers
+    return await _bitbucket_paginated_get(
+        f"{api_base}/repositories/{context.repo_path}/pullrequests",
         headers,
         params={"state": "OPEN,MERGED,DECLINED,SUPERSEDED"},
     )
 
 
-def _create_bitbucket_pr(context: RepoContext, pr: dict[str, Any]) -> None:
+async def _create_bitbucket_pr(context: RepoContext, pr: dict[str, Any]) -> None:
     api_base = _provider_api_base(context)
-    headers = _bitbucket_headers(context.token)
+    headers = context.headers
 
-    created = _request_json(
+    created = await _request_json(
         "POST",
-        f"{api_base}/repositories/{context.bitbucket_repo_path}/pullrequests",
+        f"{api_base}/repositories/{context.repo_path}/pullrequests",
         headers,
         json_body={
             "title": pr.get("title", "Untitled PR"),
@@ -618,88 +1043,104 @@ def _create_bitbucket_pr(context: RepoContext, pr: dict[str, Any]) -> None:
     )
 
     if pr.get("state") == "closed":
-        _request_raw(
+        await _request_raw(
             "POST",
-            f"{api_base}/repositories/{context.bitbucket_repo_path}/pullrequests/{created['id']}/decline",
+            f"{api_base}/repositories/{context.repo_path}/pullrequests/{created['id']}/decline",
             headers,
         )
 
 
-def _normalize_pr_from_source(provider: str, pull_request: dict[str, Any]) -> dict[str, Any]:
-    if provider == "github":
-        return {
-            "title": pull_request.get("title", "Untitled PR"),
-            "description": pull_request.get("body") or "",
-            "source_branch": pull_request.get("head", {}).get("ref", ""),
-            "target_branch": pull_request.get("base", {}).get("ref", ""),
-            "state": pull_request.get("state", "open"),
-            "draft": pull_request.get("draft", False),
-        }
+def _normalize_github_pr(pull_request: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "title": pull_request.get("title", "Untitled PR"),
+        "description": pull_request.get("body") or "",
+        "source_branch": pull_request.get("head", {}).get("ref", ""),
+        "target_branch": pull_request.get("base", {}).get("ref", ""),
+        "state": pull_request.get("state", "open"),
+        "draft": pull_request.get("draft", False),
+    }
 
-    if provider == "gitlab":
-        return {
-            "title": pull_request.get("title", "Untitled MR"),
-            "description": pull_request.get("description") or "",
-            "source_branch": pull_request.get("source_branch", ""),
-            "target_branch": pull_request.get("target_branch", ""),
-            "state": "closed" if pull_request.get("state") == "closed" else "open",
-            "draft": False,
-        }
 
-    if provider == "bitbucket":
-        source_branch = (
-            pull_request.get("source", {}).get("branch", {}).get("name", "")
-        )
-        target_branch = (
-            pull_request.get("destination", {}).get("branch", {}).get("name", "")
-        )
-        state = pull_request.get("state", "OPEN")
-        return {
-            "title": pull_request.get("title", "Untitled PR"),
-            "description": pull_request.get("description") or "",
-            "source_branch": source_branch,
-            "target_branch": target_branch,
-            "state": "closed" if state in {"DECLINED", "SUPERSEDED"} else "open",
-            "draft": False,
-        }
+def _normalize_gitlab_mr(pull_request: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "title": pull_request.get("title", "Untitled MR"),
+        "description": pull_request.get("description") or "",
+        "source_branch": pull_request.get("source_branch", ""),
+        "target_branch": pull_request.get("target_branch", ""),
+        "state": "closed" if pull_request.get("state") == "closed" else "open",
+        "draft": False,
+    }
 
-    raise ValueError(f"Unsupported provider for PR normalization: {provider}")
 
+def _normalize_bitbucket_pr(pull_request: dict[str, Any]) -> dict[str, Any]:
+    source_branch = (
+        pull_request.get("source", {}).get("branch", {}).get("name", "")
+    )
+    target_branch = (
+        pull_request.get("destination", {}).get("branch", {}).get("name", "")
+    )
+    state = pull_request.get("state", "OPEN")
+    return {
+        "title": pull_request.get("title", "Untitled PR"),
+        "description": pull_request.get("description") or "",
+        "source_branch": source_branch,
+        "target_branch": target_branch,
+        "state": "closed" if state in {"DECLINED", "SUPERSEDED"} else "open",
+        "draft": False,
+    }
 
-def migrate_pull_requests(source: RepoContext, destination: RepoContext) -> dict[str, Any]:
+
+PR_LISTERS: dict[str, ItemLister] = {
+    "github": _list_github_prs,
+    "gitlab": _list_gitlab_mrs,
+    "bitbucket": _list_bitbucket_prs,
+}
+PR_CREATORS: dict[str, ItemCreator] = {
+    "github": _create_github_pr,
+    "gitlab": _create_gitlab_mr,
+    "bitbucket": _create_bitbucket_pr,
+}
+PR_NORMALIZERS: dict[str, ItemNormalizer] = {
+    "github": _normalize_github_pr,
+    "gitlab": _normalize_gitlab_mr,
+    "bitbucket": _normalize_bitbucket_pr,
+}
+
+
+async def migrate_pull_requests(source: RepoContext, destination: RepoContext) -> dict[str, Any]:
     if not _metadata_supported(source, destination):
         return {
             "status": "unsupported",
             "message": f"PR migration supports providers {sorted(METADATA_SUPPORTED_PROVIDERS)}. Got {source.provider} -> {destination.provider}",
         }
 
-    if source.provider == "github":
-        source_items = _list_github_prs(source)
-    elif source.provider == "gitlab":
-        source_items = _list_gitlab_mrs(source)
-    else:
-        source_items = _list_bitbucket_prs(source)
+    source_items = await PR_LISTERS[source.provider](source)
+    normalize = PR_NORMALIZERS[source.provider]
+    create = PR_CREATORS[destination.provider]
 
-    created = 0
+    pending: list[dict[str, Any]] = []
     skipped = 0
-    failed = 0
 
     for item in source_items:
-        normalized = _normalize_pr_from_source(source.provider, item)
+        normalized = normalize(item)
         if not normalized["source_branch"] or not normalized["target_branch"]:
             skipped += 1
             continue
+        pending.append(normalized)
 
-        try:
-            if destination.provider == "github":
-                _create_github_pr(destination, normalized)
-            elif destination.provider == "gitlab":
-                _create_gitlab_mr(destination, normalized)
-            else:
-                _create_bitbucket_pr(destination, normalized)
-            created += 1
-        except Exception:
-            failed += 1
+    async def create_one(normalized: dict[str, Any]) -> str | None:
+        async with metadata_slots:
+            return await create(destination, normalized)
+
+    outcomes = await asyncio.gather(
+        *(create_one(normalized) for normalized in pending),
+        return_exceptions=True,
+    )
+    failed = sum(isinstance(outcome, Exception) for outcome in outcomes)
+    created = len(outcomes) - failed
+
+    to_close = [outcome for outcome in outcomes if isinstance(outcome, str)]
+    closed = await _close_github_nodes(destination, "closePullRequest", "pullRequestId", to_close) if to_close else 0
 
     return {
         "status": "completed",
@@ -707,58 +1148,33 @@ def migrate_pull_requests(source: RepoContext, destination: RepoContext) -> dict
         "created": created,
         "skipped": skipped,
         "failed": failed,
+        "close_failed": len(to_close) - closed,
     }
 
 
-def _list_github_users(context: RepoContext) -> list[str]:
+async def _list_github_users(context: RepoContext) -> list[str]:
     api_base = _provider_api_base(context)
-    headers = _github_headers(context.token)
-    usernames: list[str] = []
-
-    for page in range(1, 11):
-        payload = _request_json(
-            "GET",
-            f"{api_base}/repos/{context.github_repo_path}/collaborators",
-            headers,
-            params={"per_page": 100, "page": page},
-        )
-        if not payload:
-            break
-
-        usernames.extend([item.get("login") for item in payload if item.get("login")])
-
-        if len(payload) < 100:
-            break
-
-    return sorted(set(usernames))
+    headers = context.headers
+    payload = await _link_paginated_get(
+        f"{api_base}/repos/{context.repo_path}/collaborators",
+        headers,
+    )
+    return sorted({item.get("login") for item in payload if item.get("login")})
 
 
-def _list_gitlab_users(context: RepoContext) -> list[str]:
+async def _list_gitlab_users(context: RepoContext) -> list[str]:
     api_base = _provider_api_base(context)
-    headers = _gitlab_headers(context.token)
-    usernames: list[str] = []
-
-    for page in range(1, 11):
-        payload = _request_json(
-            "GET",
-            f"{api_base}/projects/{context.gitlab_project_id}/members/all",
-            headers,
-            params={"per_page": 100, "page": page},
-        )
-        if not payload:
-            break
-
-        usernames.extend([item.get("username") for item in payload if item.get("username")])
-
-        if len(payload) < 100:
-            break
-
-    return sorted(set(usernames))
+    headers = context.headers
+    payload = await _link_paginated_get(
+        f"{api_base}/projects/{context.project_id}/members/all",
+        headers,
+    )
+    return sorted({item.get("username") for item in payload if item.get("username")})
 
 
-def _list_bitbucket_users(context: RepoContext) -> list[str]:
+async def _list_bitbucket_users(context: RepoContext) -> list[str]:
     api_base = _provider_api_base(context)
-    headers = _bitbucket_headers(context.token)
+    headers = context.headers
     users: set[str] = set()
 
     def collect_usernames(items: list[dict[str, Any]], *, wrapped_user_key: str | None = None) -> None:
@@ -768,27 +1184,18 @@ def _list_bitbucket_users(context: RepoContext) -> list[str]:
             if username:
                 users.add(username)
 
-    def safe_collect(callable_fetch: Any, extractor: Any) -> None:
+    def user_fields(*user_keys: str) -> str:
+        prefixes = [f"values.{key}." for key in user_keys] or ["values."]
+        return ",".join(
+            ["next"] + [f"{prefix}{name}" for prefix in prefixes for name in ("username", "nickname", "display_name")]
+        )
+
+    async def safe_collect(fetch: Awaitable[list[dict[str, Any]]], extractor: Any) -> None:
         try:
-            extractor(callable_fetch())
+            extractor(await fetch)
         except Exception:
             return
 
-    safe_collect(
-        lambda: _bitbucket_paginated_get(
-            f"{api_base}/repositories/{context.bitbucket_repo_path}/default-reviewers",
-            headers,
-        ),
-        lambda values: collect_usernames(values),
-    )
-    safe_collect(
-        lambda: _bitbucket_paginated_get(
-            f"{api_base}/repositories/{context.bitbucket_repo_path}/watchers",
-            headers,
-        ),
-        lambda values: collect_usernames(values, wrapped_user_key="user"),
-    )
-
     def collect_issue_users(values: list[dict[str, Any]]) -> None:
         for item in values:
             for user_obj in (item.get("reporter", {}), item.get("assignee", {})):
@@ -796,90 +1203,100 @@ def _list_bitbucket_users(context: RepoContext) -> list[str]:
                 if username:
                     users.add(username)
 
-    safe_collect(
-        lambda: _bitbucket_paginated_get(
-            f"{api_base}/repositories/{context.bitbucket_repo_path}/issues",
-            headers,
+    await asyncio.gather(
+        safe_collect(
+            _bitbucket_paginated_get(
+                f"{api_base}/repositories/{context.repo_path}/default-reviewers",
+                headers,
+                params={"fields": user_fields()},
+            ),
+            lambda values: collect_usernames(values),
         ),
-        collect_issue_users,
-    )
-    safe_collect(
-        lambda: _bitbucket_paginated_get(
-            f"{api_base}/repositories/{context.bitbucket_repo_path}/pullrequests",
-            headers,
-            params={"state": "OPEN,MERGED,DECLINED,SUPERSEDED"},
+        safe_collect(
+            _bitbucket_paginated_get(
+                f"{api_base}/repositories/{context.repo_path}/watchers",
+                headers,
+                params={"fields": user_fields("user")},
+            ),
+            lambda values: collect_usernames(values, wrapped_user_key="user"),
+        ),
+        safe_collect(
+            _bitbucket_paginated_get(
+                f"{api_base}/repositories/{context.repo_path}/issues",
+                headers,
+                params={"fields": user_fields("reporter", "assignee")},
+            ),
+            collect_issue_users,
+        ),
+        safe_collect(
+            _bitbucket_paginated_get(
+                f"{api_base}/repositories/{context.repo_path}/pullrequests",
+                headers,
+                params={"state": "OPEN,MERGED,DECLINED,SUPERSEDED", "fields": user_fields("author")},
+            ),
+            lambda values: collect_usernames(values, wrapped_user_key="author"),
         ),
-        lambda values: collect_usernames(values, wrapped_user_key="author"),
     )
 
     return sorted(users)
 
 
-def _user_exists_on_destination(context: RepoContext, username: str) -> bool:
-    if context.provider == "github":
-        api_base = _provider_api_base(context)
-        headers = _github_headers(context.token)
-        response = requests.get(
-            f"{api_base}/users/{urllib.parse.quote(username, safe='')}",
-            headers=headers,
-            timeout=REQUEST_TIMEOUT_SECONDS,
-        )
-        return response.status_code == 200
+GITLAB_USERS_QUERY = """
+query($usernames: [String!]) {
+  users(usernames: $usernames, first: 100) { nodes { username } }
+}
+"""
 
-    if context.provider == "gitlab":
-        api_base = _provider_api_base(context)
-        headers = _gitlab_headers(context.token)
-        payload = _request_json(
-            "GET",
-            f"{api_base}/users",
-            headers,
-            params={"username": username, "per_page": 1},
-        )
-        return bool(payload)
 
+async def _existing_destination_users(context: RepoContext, usernames: list[str]) -> set[str]:
     if context.provider == "bitbucket":
+        return set(usernames) & set(await _list_bitbucket_users(context))
+
+    async def check_batch(batch: list[str]) -> set[str]:
         try:
-            destination_users = set(_list_bitbucket_users(context))
-            return username in destination_users
+            async with metadata_slots:
+                if context.provider == "github":
+                    declarations = ", ".join(f"$l{index}: String!" for index in range(len(batch)))
+                    fields = " ".join(f"u{index}: user(login: $l{index}) {{ login }}" for index in range(len(batch)))
+                    data = await _graphql(
+                        context,
+                        f"query({declarations}) {{ {fields} }}",
+                        {f"l{index}": username for index, username in enumerate(batch)},
+                    )
+                    return {username for index, username in enumerate(batch) if data.get(f"u{index}")}
+
+                data = await _graphql(context, GITLAB_USERS_QUERY, {"usernames": batch})
         except Exception:
-            return False
+            return set()
+        found = {node["username"].lower() for node in (data.get("users") or {}).get("nodes", [])}
+        return {username for username in batch if username.lower() in found}
+
+    batches = [usernames[start : start + GRAPHQL_BATCH_SIZE] for start in range(0, len(usernames), GRAPHQL_BATCH_SIZE)]
+    existing: set[str] = set()
+    for found in await asyncio.gather(*(check_batch(batch) for batch in batches)):
+        existing |= found
+    return existing
+
 
-    return False
+USER_LISTERS: dict[str, Callable[[RepoContext], Awaitable[list[str]]]] = {
+    "github": _list_github_users,
+    "gitlab": _list_gitlab_users,
+    "bitbucket": _list_bitbucket_users,
+}
 
 
-def migrate_users(source: RepoContext, destination: RepoContext) -> dict[str, Any]:
+async def migrate_users(source: RepoContext, destination: RepoContext) -> dict[str, Any]:
     if not _metadata_supported(source, destination):
         return {
             "status": "unsupported",
             "message": f"User mapping supports providers {sorted(METADATA_SUPPORTED_PROVIDERS)}. Got {source.provider} -> {destination.provider}",
         }
 
-    if source.provider == "github":
-        source_users = _list_github_users(source)
-    elif source.provider == "gitlab":
-        source_users = _list_gitlab_users(source)
-    else:
-        source_users = _list_bitbucket_users(source)
+    source_users = await USER_LISTERS[source.provider](source)
 
-    mapped: list[str] = []
-    unmapped: list[str] = []
-    destination_bitbucket_user_set: set[str] | None = None
-    if destination.provider == "bitbucket":
-        destination_bitbucket_user_set = set(_list_bitbucket_users(destination))
-
-    for username in source_users:
-        try:
-            if destination_bitbucket_user_set is not None:
-                exists = username in destination_bitbucket_user_set
-            else:
-                exists = _user_exists_on_destination(destination, username)
-
-            if exists:
-                mapped.append(username)
-            else:
-                unmapped.append(username)
-        except Exception:
-            unmapped.append(username)
+    existing = await _existing_destination_users(destination, source_users)
+    mapped = [username for username in source_users if username in existing]
+    unmapped = [username for username in source_users if username not in existing]
 
     return {
         "status": "completed",
@@ -892,89 +1309,185 @@ def migrate_users(source: RepoContext, destination: RepoContext) -> dict[str, An
     }
 
 
-def perform_migration(job_id: str, req: MigrationRequest) -> None:
-    repo_name = req.source_repo_url.rstrip("/").split("/")[-1].replace(".git", "") or "repository"
-    temp_dir = f"./temp_repos/{job_id}_{repo_name}"
+def _parse_ref_listing(output: str) -> dict[str, str]:
+    refs: dict[str, str] = {}
+    for line in output.splitlines():
+        sha, _, ref = line.partition("\t")
+        if ref:
+            refs[ref] = sha
+    return refs
 
-    _update_job(job_id, status="processing", results={}, error=None)
 
-    source_auth = get_auth_url(req.source_repo_url, req.source_token, req.source_type)
-    dest_auth = get_auth_url(req.dest_repo_url, req.dest_token, req.dest_type)
+async def _push_refs(job_id: str, repo_path: str, dest_auth: str, actions: MigrationActions) -> dict[str, Any]:
+    results: dict[str, Any] = {}
 
-    source_context = _repo_context(req.source_type, req.source_token, req.source_repo_url)
-    destination_context = _repo_context(req.dest_type, req.dest_token, req.dest_repo_url)
+    # Repository-level mirror takes precedence because it already includes refs.
+    if actions.migrate_repo:
+        local_refs = _parse_ref_listing(
+            await _git("-C", repo_path, "for-each-ref", "--format=%(objectname)%09%(refname)")
+        )
+        remote_refs = _parse_ref_listing(await _git("ls-remote", "--refs", "--heads", "--tags", dest_auth))
+        changed = [ref for ref, sha in local_refs.items() if remote_refs.get(ref) != sha]
+        stale = remote_refs.keys() - local_refs.keys()
+        results["repository"] = "success"
+        results["repository_changed"] = bool(changed or stale)
+        if not results["repository_changed"]:
+            return results
+
+        batch_size = actions.push_batch_size
+        if len(changed) > batch_size:
+            for start in range(0, len(changed), batch_size):
+                batch = changed[start : start + batch_size]
+                await _git("-C", repo_path, "push", dest_auth, *(f"+{ref}:{ref}" for ref in batch))
+                done = min(start + batch_size, len(changed))
+                await _update_job(job_id, results={"repo_progress": f"{done}/{len(changed)}"})
+        await _git("-C", repo_path, "push", "--mirror", dest_auth)
+        return results
+
+    refspecs: list[str] = []
+
+    if actions.migrate_branches:
+        refspecs.append("refs/heads/*:refs/heads/*")
+
+    pushed: list[str] = []
+    missing: list[str] = []
+    if actions.specific_branches:
+        existing = set((await _git("-C", repo_path, "for-each-ref", "--format=%(refname)", "refs/heads/")).splitlines())
+        for branch in actions.specific_branches:
+            ref = f"refs/heads/{branch}"
+            if ref not in existing:
+                missing.append(branch)
+                continue
+            refspecs.append(f"{ref}:{ref}")
+            pushed.append(branch)
+
+    if actions.migrate_tags:
+        refspecs.append("refs/tags/*:refs/tags/*")
+
+    if refspecs:
+        await _git("-C", repo_path, "push", "--atomic", dest_auth, *refspecs)
+
+    if actions.migrate_branches:
+        results["branches"] = "success"
+    if pushed:
+        results["specific_branches"] = {"pushed": pushed}
+    if missing:
+        results["specific_branches_missing"] = missing
+    if actions.migrate_tags:
+        results["tags"] = "success"
+
+    if not (actions.migrate_branches or actions.specific_branches or actions.migrate_tags):
+        results["repository"] = "skipped"
+
+    return results
+
+
+@dataclass(frozen=True)
+class MigrationPlan:
+    request: MigrationRequest
+    repo_name: str
+    source_auth: str
+    dest_auth: str
+    clone_options: tuple[str, ...]
+    mirror_path: str | None
+
+
+def _compile_plan(req: MigrationRequest) -> MigrationPlan:
+    clone_options = tuple(_clone_options(req.actions))
+    return MigrationPlan(
+        request=req,
+        repo_name=_repo_name(req.source_repo_url),
+        source_auth=get_auth_url(req.source_repo_url, req.source_token, req.source_type),
+        dest_auth=get_auth_url(req.dest_repo_url, req.dest_token, req.dest_type),
+        clone_options=clone_options,
+        mirror_path=None if clone_options else _mirror_path(req.source_repo_url),
+    )
 
-    try:
-        os.makedirs("./temp_repos", exist_ok=True)
-        repo = Repo.clone_from(source_auth, temp_dir, bare=True)
-        if "migration_dest" in [remote.name for remote in repo.remotes]:
-            repo.delete_remote("migration_dest")
-        repo.create_remote("migration_dest", dest_auth)
 
-        results: dict[str, Any] = {}
+async def perform_migration(job_id: str, plan: MigrationPlan) -> None:
+    req = plan.request
+    source_auth = plan.source_auth
+    dest_auth = plan.dest_auth
+    temp_dir: str | None = None
+
+    await _update_job(job_id, status="processing", results={}, error=None)
+
+    try:
         actions = req.actions
 
-        # Repository-level mirror takes precedence because it already includes refs.
-        if actions.migrate_repo:
-            repo.git.push("--mirror", "migration_dest")
-            results["repository"] = "success"
+        if plan.mirror_path is not None:
+            os.makedirs(MIRROR_CACHE_DIR, exist_ok=True)
+            mirror_path = plan.mirror_path
+            # The file lock also covers other server processes sharing the cache.
+            async with AsyncFileLock(f"{mirror_path}.lock"):
+                async with git_fetch_slots:
+                    await _sync_mirror(mirror_path, source_auth)
+                async with git_push_slots:
+                    results = await _push_refs(job_id, mirror_path, dest_auth, actions)
+                await _maintain_mirror(mirror_path)
         else:
-            if actions.migrate_branches:
-                repo.git.push("migration_dest", "refs/heads/*:refs/heads/*")
-                results["branches"] = "success"
-
-            if actions.specific_branches:
-                pushed: list[str] = []
-                missing: list[str] = []
-                for branch in actions.specific_branches:
-                    ref = f"refs/heads/{branch}"
-                    try:
-                        repo.git.rev_parse("--verify", ref)
-                    except GitCommandError:
-                        missing.append(branch)
-                        continue
-                    repo.git.push("migration_dest", f"{ref}:{ref}")
-                    pushed.append(branch)
-
-                if pushed:
-                    results["specific_branches"] = {"pushed": pushed}
-                if missing:
-                    results["specific_branches_missing"] = missing
-
-            if actions.migrate_tags:
-                repo.git.push("migration_dest", "refs/tags/*:refs/tags/*")
-                results["tags"] = "success"
-
-            if not (actions.migrate_branches or actions.specific_branches or actions.migrate_tags):
-                results["repository"] = "skipped"
-
-        if actions.migrate_issues:
-            results["issues"] = migrate_issues(source_context, destination_context)
-
-        if actions.migrate_prs:
-            results["prs"] = migrate_pull_requests(source_context, destination_context)
-
-        if actions.migrate_users:
-            results["users"] = migrate_users(source_context, destination_context)
-
-        _update_job(job_id, status="completed", results=results)
+            temp_root = _temp_repos_root()
+            os.makedirs(temp_root, exist_ok=True)
+            temp_dir = tempfile.mkdtemp(prefix=f"{job_id}_{plan.repo_name}_", dir=temp_root)
+            async with git_fetch_slots:
+                await _git("clone", "--bare", "--quiet", *plan.clone_options, source_auth, temp_dir)
+            async with git_push_slots:
+                results = await _push_refs(job_id, temp_dir, dest_auth, actions)
+
+        metadata_steps = {
+            "issues": (actions.migrate_issues, migrate_issues),
+            "prs": (actions.migrate_prs, migrate_pull_requests),
+            "users": (actions.migrate_users, migrate_users),
+        }
+        requested = {name: step for name, (enabled, step) in metadata_steps.items() if enabled}
+        if requested:
+            source_context = _repo_context(req.source_type, req.source_token, req.source_repo_url)
+            destination_context = _repo_context(req.dest_type, req.dest_token, req.dest_repo_url)
+            outcomes = await asyncio.gather(
+                *(step(source_context, destination_context) for step in requested.values()),
+                return_exceptions=True,
+            )
+            for name, outcome in zip(requested, outcomes):
+                if isinstance(outcome, BaseException):
+                    raise outcome
+                results[name] = outcome
+
+        await _update_job(job_id, status="completed", results=results)
 
     except GitCommandError as exc:
-        error_message = _redact_sensitive(str(exc), req)
-        _update_job(job_id, status="failed", error=f"Git command failed: {error_message}")
+        error_message = _job_error(str(exc), req)
+        await _update_job(job_id, status="failed", error=f"Git command failed: {error_message}")
     except Exception as exc:  # noqa: BLE001
-        error_message = _redact_sensitive(str(exc), req)
-        _update_job(job_id, status="failed", error=error_message)
+        error_message = _job_error(str(exc), req)
+        await _update_job(job_id, status="failed", error=error_message)
     finally:
-        if os.path.exists(temp_dir):
-            shutil.rmtree(temp_dir, ignore_errors=True)
+        if temp_dir is not None:
+            asyncio.get_running_loop().run_in_executor(trash_executor, _fast_rmtree, temp_dir)
+
+
+def _source_repo_lock(source_repo_url: str) -> asyncio.Lock:
+    key = source_repo_url.strip().rstrip("/")
+    return source_repo_locks.setdefault(key, asyncio.Lock())
+
+
+async def run_migration_job(job_id: str, plan: MigrationPlan) -> None:
+    async with _source_repo_lock(plan.request.source_repo_url):
+        await perform_migration(job_id, plan)
+
+
+def _plan_or_422(request: MigrationRequest) -> MigrationPlan:
+    try:
+        return _compile_plan(request)
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc)) from exc
 
 
 @app.post("/migrate")
 async def run_manual_sync(request: MigrationRequest, background_tasks: BackgroundTasks) -> dict[str, str]:
+    plan = _plan_or_422(request)
     job_id = f"manual_{uuid.uuid4()}"
-    _update_job(job_id, status="pending", results={}, error=None)
-    background_tasks.add_task(perform_migration, job_id, request)
+    await _update_job(job_id, status="pending", results={}, error=None)
+    background_tasks.add_task(run_migration_job, job_id, plan)
     return {"job_id": job_id, "message": "Manual migration started"}
 
 
@@ -983,14 +1496,15 @@ async def run_scheduled_sync(
     request: MigrationRequest,
     interval_minutes: int = Query(..., ge=1),
 ) -> dict[str, str]:
-    job_id = f"sched_{uuid.uuid4()}"
-    _update_job(job_id, status="scheduled", results={}, error=None)
+    plan = _plan_or_422(request)
+    job_id = f"{SCHEDULED_JOB_PREFIX}{uuid.uuid4()}"
+    await _update_job(job_id, status="scheduled", results={}, error=None)
 
     scheduler.add_job(
-        func=perform_migration,
+        func=run_migration_job,
         trigger="interval",
         minutes=interval_minutes,
-        args=[job_id, request],
+        args=[job_id, plan],
         id=job_id,
     )
 
@@ -998,9 +1512,8 @@ async def run_scheduled_sync(
 
 
 @app.get("/status/{job_id}")
-async def get_status(job_id: str) -> dict[str, Any]:
-    with migration_jobs_lock:
-        return migration_jobs.get(job_id, {"status": "not_found"})
+async def get_status(job_id: str) -> Response:
+    return Response(content=await _job_status_json(job_id) or NOT_FOUND_STATUS_JSON, media_type="application/json")
 
 
 @app.get("/")
@@ -1008,11 +1521,12 @@ def health_check() -> dict[str, str]:
     return {"status": "online", "service": "Git Migrator Backend"}
 
 
-@app.on_event("shutdown")
-def shutdown_event() -> None:
-    if scheduler.running:
-        scheduler.shutdown(wait=False)
-
-
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.environ.get("UVICORN_WORKERS", "1")),
+    )